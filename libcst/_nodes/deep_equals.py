@@ -7,8 +7,10 @@
 Provides the implementation of `CSTNode.deep_equals`.
 """
 
+from collections.abc import Sequence as ABCSequence
 from dataclasses import fields
-from typing import Sequence
+from functools import lru_cache
+from typing import Sequence, Tuple, Type
 
 from libcst._nodes.base import CSTNode
 
@@ -17,9 +19,9 @@ def deep_equals(a: object, b: object) -> bool:
     if isinstance(a, CSTNode) and isinstance(b, CSTNode):
         return _deep_equals_cst_node(a, b)
     elif (
-        isinstance(a, Sequence)
+        isinstance(a, ABCSequence)
         and not isinstance(a, (str, bytes))
-        and isinstance(b, Sequence)
+        and isinstance(b, ABCSequence)
         and not isinstance(b, (str, bytes))
     ):
         return _deep_equals_sequence(a, b)
@@ -42,15 +44,20 @@ def _deep_equals_sequence(a: Sequence[object], b: Sequence[object]) -> bool:
     return all(deep_equals(a_el, b_el) for (a_el, b_el) in zip(a, b))
 
 
+@lru_cache(maxsize=None)
+def _compared_field_names(node_type: Type[CSTNode]) -> Tuple[str, ...]:
+    # Ignore metadata and other hidden fields
+    return tuple(f.name for f in fields(node_type) if f.compare is True)
+
+
 def _deep_equals_cst_node(a: "CSTNode", b: "CSTNode") -> bool:
     if type(a) is not type(b):
         return False
     if a is b:  # short-circuit
         return True
-    # Ignore metadata and other hidden fields
-    for field in (f for f in fields(a) if f.compare is True):
-        a_value = getattr(a, field.name)
-        b_value = getattr(b, field.name)
+    for name in _compared_field_names(type(a)):
+        a_value = getattr(a, name)
+        b_value = getattr(b, name)
         if not deep_equals(a_value, b_value):
             return False
     return True
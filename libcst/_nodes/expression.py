@@ -10,6 +10,7 @@ from ast import literal_eval
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import auto, Enum
+from itertools import chain
 from tokenize import (
     Floatnumber as FLOATNUMBER_RE,
     Imagnumber as IMAGNUMBER_RE,
@@ -1889,8 +1890,6 @@ class Parameters(CSTNode):
     posonly_ind: Union[ParamSlash, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _validate_stars_sequence(self, vals: Sequence[Param], *, section: str) -> None:
-        if len(vals) == 0:
-            return
         for val in vals:
             if isinstance(val.star, str) and val.star != "":
                 raise CSTValidationError(
@@ -1911,19 +1910,15 @@ class Parameters(CSTNode):
 
     def _validate_defaults(self) -> None:
         seen_default = False
-        # pyre-fixme[60]: Concatenation not yet support for multiple variadic
-        #  tuples: `*self.posonly_params, *self.params`.
-        for param in (*self.posonly_params, *self.params):
-            if param.default:
+        for param in chain(self.posonly_params, self.params):
+            if param.default is not None:
                 # Mark that we've moved onto defaults
-                if not seen_default:
-                    seen_default = True
-            else:
-                if seen_default:
-                    # We accidentally included a non-default after a default arg!
-                    raise CSTValidationError(
-                        "Cannot have param without defaults following a param with defaults."
-                    )
+                seen_default = True
+            elif seen_default:
+                # We accidentally included a non-default after a default arg!
+                raise CSTValidationError(
+                    "Cannot have param without defaults following a param with defaults."
+                )
         star_arg = self.star_arg
         if isinstance(star_arg, Param) and star_arg.default is not None:
             raise CSTValidationError("Cannot have default for star_arg.")
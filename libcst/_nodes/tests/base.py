@@ -4,6 +4,8 @@
 # LICENSE file in the root directory of this source tree.
 
 import dataclasses
+import functools
+import re
 from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import Any, Callable, Iterable, List, Optional, Sequence, Type
@@ -40,6 +42,29 @@ def _cst_node_equality_func(
         raise AssertionError(f"\n{a!r}\nis not deeply equal to \n{b!r}{suffix}")
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(parser: Callable[[str], cst.CSTNode], code: str) -> cst.CSTNode:
+    """
+    Many node tests parse the same snippets of code (e.g. ``"lambda: 5"``), and
+    parsing is deterministic and produces immutable trees, so we can share the
+    result across tests instead of parsing the same string repeatedly.
+    """
+    return parser(code)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(expected_re: str) -> "re.Pattern[str]":
+    """
+    The same handful of error messages are checked by hundreds of invalid node
+    tests, so keep the compiled patterns around rather than relying on the
+    ``re`` module's global cache, which is shared with everything else.
+    """
+    return re.compile(expected_re)
+
+
+# Return the same parser for the same config, so that _parse_cached can share
+# results between test cases that each ask for e.g. ``python_version="3.8"``.
+@functools.lru_cache(maxsize=None)
 def parse_expression_as(**config: Any) -> Callable[[str], cst.BaseExpression]:
     def inner(code: str) -> cst.BaseExpression:
         return cst.parse_expression(code, config=cst.PartialParserConfig(**config))
@@ -47,6 +72,7 @@ def parse_expression_as(**config: Any) -> Callable[[str], cst.BaseExpression]:
     return inner
 
 
+@functools.lru_cache(maxsize=None)
 def parse_statement_as(**config: Any) -> Callable[[str], cst.BaseStatement]:
     def inner(code: str) -> cst.BaseStatement:
         return cst.parse_statement(code, config=cst.PartialParserConfig(**config))
@@ -77,7 +103,7 @@ class CSTNodeTest(UnitTest):
         self.__assert_codegen(node, code, expected_position)
 
         if parser is not None:
-            parsed_node = parser(code)
+            parsed_node = _parse_cached(parser, code)
             self.assertEqual(parsed_node, node)
 
         # Tests of children should unwrap DummyIndentedBlock first, because we don't
@@ -92,13 +118,15 @@ class CSTNodeTest(UnitTest):
     def assert_invalid(
         self, get_node: Callable[[], cst.CSTNode], expected_re: str
     ) -> None:
-        with self.assertRaisesRegex(cst.CSTValidationError, expected_re):
+        with self.assertRaisesRegex(
+            cst.CSTValidationError, _compile_cached(expected_re)
+        ):
             get_node()
 
     def assert_invalid_types(
         self, get_node: Callable[[], cst.CSTNode], expected_re: str
     ) -> None:
-        with self.assertRaisesRegex(TypeError, expected_re):
+        with self.assertRaisesRegex(TypeError, _compile_cached(expected_re)):
             get_node().validate_types_shallow()
 
     def __assert_codegen(
@@ -11,32 +11,61 @@ from libcst._nodes.tests.base import CSTNodeTest
 from libcst.metadata import CodeRange
 from libcst.testing.utils import data_provider
 
+_ONE_POINT_ZERO = cst.Float("1.0")
+_ONE_POINT_FIVE = cst.Float("1.5")
+_P_BAR_ONE = cst.Param(cst.Name("bar"), default=cst.SimpleString('"one"'))
+_P_BAZ = cst.Param(cst.Name("baz"))
+_P_BIZ_TWO = cst.Param(cst.Name("biz"), default=cst.SimpleString('"two"'))
+_ARG_PARAMS = (cst.Param(cst.Name("arg")),)
+_KWONLY_PARAMS = (_P_BAR_ONE, _P_BAZ, _P_BIZ_TWO)
+
+_PARSED_KWONLY_PARAMS = (
+    cst.Param(
+        cst.Name("bar"),
+        default=cst.SimpleString('"one"'),
+        equal=cst.AssignEqual(),
+        star="",
+        comma=cst.Comma(whitespace_after=cst.SimpleWhitespace(" ")),
+    ),
+    cst.Param(
+        cst.Name("baz"),
+        star="",
+        comma=cst.Comma(whitespace_after=cst.SimpleWhitespace(" ")),
+    ),
+    cst.Param(
+        cst.Name("biz"),
+        default=cst.SimpleString('"two"'),
+        equal=cst.AssignEqual(),
+        star="",
+    ),
+)
+
 
 class LambdaCreationTest(CSTNodeTest):
     @data_provider(
-        (
-            # Simple lambda
-            (cst.Lambda(cst.Parameters(), cst.Integer("5")), "lambda: 5"),
-            # Test basic positional only params
-            {
-                "node": cst.Lambda(
+        {
+            "simple_lambda": (
+                lambda: cst.Lambda(cst.Parameters(), cst.Integer("5")),
+                "lambda: 5",
+            ),
+            "posonly_params": {
+                "get_node": lambda: cst.Lambda(
                     cst.Parameters(
                         posonly_params=(
                             cst.Param(cst.Name("bar")),
-                            cst.Param(cst.Name("baz")),
+                            _P_BAZ,
                         )
                     ),
                     cst.Integer("5"),
                 ),
                 "code": "lambda bar, baz, /: 5",
             },
-            # Test basic positional only params with extra trailing whitespace
-            {
-                "node": cst.Lambda(
+            "posonly_params_trailing_whitespace": {
+                "get_node": lambda: cst.Lambda(
                     cst.Parameters(
                         posonly_params=(
                             cst.Param(cst.Name("bar")),
-                            cst.Param(cst.Name("baz")),
+                            _P_BAZ,
                         ),
                         posonly_ind=cst.ParamSlash(
                             whitespace_after=cst.SimpleWhitespace(" ")
@@ -46,24 +75,18 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "code": "lambda bar, baz, / : 5",
             },
-            # Test basic positional params
-            (
-                cst.Lambda(
-                    cst.Parameters(
-                        params=(cst.Param(cst.Name("bar")), cst.Param(cst.Name("baz")))
-                    ),
+            "params": (
+                lambda: cst.Lambda(
+                    cst.Parameters(params=(cst.Param(cst.Name("bar")), _P_BAZ)),
                     cst.Integer("5"),
                 ),
                 "lambda bar, baz: 5",
             ),
-            # Test basic positional default params
-            (
-                cst.Lambda(
+            "default_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
-                            cst.Param(
-                                cst.Name("bar"), default=cst.SimpleString('"one"')
-                            ),
+                            _P_BAR_ONE,
                             cst.Param(cst.Name("baz"), default=cst.Integer("5")),
                         )
                     ),
@@ -71,9 +94,8 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 'lambda bar = "one", baz = 5: 5',
             ),
-            # Mixed positional and default params.
-            (
-                cst.Lambda(
+            "mixed_params_and_default_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(cst.Name("bar")),
@@ -84,153 +106,102 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "lambda bar, baz = 5: 5",
             ),
-            # Test kwonly params
-            (
-                cst.Lambda(
+            "kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"), default=cst.SimpleString('"one"')
-                            ),
-                            cst.Param(cst.Name("baz")),
+                            _P_BAR_ONE,
+                            _P_BAZ,
                         )
                     ),
                     cst.Integer("5"),
                 ),
                 'lambda *, bar = "one", baz: 5',
             ),
-            # Mixed params and kwonly_params
-            (
-                cst.Lambda(
+            "params_and_kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(cst.Name("first")),
                             cst.Param(cst.Name("second")),
                         ),
-                        kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"), default=cst.SimpleString('"one"')
-                            ),
-                            cst.Param(cst.Name("baz")),
-                            cst.Param(
-                                cst.Name("biz"), default=cst.SimpleString('"two"')
-                            ),
-                        ),
+                        kwonly_params=_KWONLY_PARAMS,
                     ),
                     cst.Integer("5"),
                 ),
                 'lambda first, second, *, bar = "one", baz, biz = "two": 5',
             ),
-            # Mixed params and kwonly_params
-            (
-                cst.Lambda(
+            "default_params_and_kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
-                            cst.Param(cst.Name("first"), default=cst.Float("1.0")),
-                            cst.Param(cst.Name("second"), default=cst.Float("1.5")),
-                        ),
-                        kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"), default=cst.SimpleString('"one"')
-                            ),
-                            cst.Param(cst.Name("baz")),
-                            cst.Param(
-                                cst.Name("biz"), default=cst.SimpleString('"two"')
-                            ),
+                            cst.Param(cst.Name("first"), default=_ONE_POINT_ZERO),
+                            cst.Param(cst.Name("second"), default=_ONE_POINT_FIVE),
                         ),
+                        kwonly_params=_KWONLY_PARAMS,
                     ),
                     cst.Integer("5"),
                 ),
                 'lambda first = 1.0, second = 1.5, *, bar = "one", baz, biz = "two": 5',
             ),
-            # Mixed params and kwonly_params
-            (
-                cst.Lambda(
+            "mixed_params_and_kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(cst.Name("first")),
                             cst.Param(cst.Name("second")),
-                            cst.Param(cst.Name("third"), default=cst.Float("1.0")),
-                            cst.Param(cst.Name("fourth"), default=cst.Float("1.5")),
-                        ),
-                        kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"), default=cst.SimpleString('"one"')
-                            ),
-                            cst.Param(cst.Name("baz")),
-                            cst.Param(
-                                cst.Name("biz"), default=cst.SimpleString('"two"')
-                            ),
+                            cst.Param(cst.Name("third"), default=_ONE_POINT_ZERO),
+                            cst.Param(cst.Name("fourth"), default=_ONE_POINT_FIVE),
                         ),
+                        kwonly_params=_KWONLY_PARAMS,
                     ),
                     cst.Integer("5"),
                 ),
                 'lambda first, second, third = 1.0, fourth = 1.5, *, bar = "one", baz, biz = "two": 5',
                 CodeRange((1, 0), (1, 84)),
             ),
-            # Test star_arg
-            (
-                cst.Lambda(
+            "star_arg": (
+                lambda: cst.Lambda(
                     cst.Parameters(star_arg=cst.Param(cst.Name("params"))),
                     cst.Integer("5"),
                 ),
                 "lambda *params: 5",
             ),
-            # Typed star_arg, include kwonly_params
-            (
-                cst.Lambda(
+            "star_arg_and_kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         star_arg=cst.Param(cst.Name("params")),
-                        kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"), default=cst.SimpleString('"one"')
-                            ),
-                            cst.Param(cst.Name("baz")),
-                            cst.Param(
-                                cst.Name("biz"), default=cst.SimpleString('"two"')
-                            ),
-                        ),
+                        kwonly_params=_KWONLY_PARAMS,
                     ),
                     cst.Integer("5"),
                 ),
                 'lambda *params, bar = "one", baz, biz = "two": 5',
             ),
-            # Mixed params, star_arg and kwonly_params
-            (
-                cst.Lambda(
+            "mixed_params_star_arg_and_kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(cst.Name("first")),
                             cst.Param(cst.Name("second")),
-                            cst.Param(cst.Name("third"), default=cst.Float("1.0")),
-                            cst.Param(cst.Name("fourth"), default=cst.Float("1.5")),
+                            cst.Param(cst.Name("third"), default=_ONE_POINT_ZERO),
+                            cst.Param(cst.Name("fourth"), default=_ONE_POINT_FIVE),
                         ),
                         star_arg=cst.Param(cst.Name("params")),
-                        kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"), default=cst.SimpleString('"one"')
-                            ),
-                            cst.Param(cst.Name("baz")),
-                            cst.Param(
-                                cst.Name("biz"), default=cst.SimpleString('"two"')
-                            ),
-                        ),
+                        kwonly_params=_KWONLY_PARAMS,
                     ),
                     cst.Integer("5"),
                 ),
                 'lambda first, second, third = 1.0, fourth = 1.5, *params, bar = "one", baz, biz = "two": 5',
             ),
-            # Test star_arg and star_kwarg
-            (
-                cst.Lambda(
+            "star_kwarg": (
+                lambda: cst.Lambda(
                     cst.Parameters(star_kwarg=cst.Param(cst.Name("kwparams"))),
                     cst.Integer("5"),
                 ),
                 "lambda **kwparams: 5",
             ),
-            # Test star_arg and kwarg
-            (
-                cst.Lambda(
+            "star_arg_and_star_kwarg": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         star_arg=cst.Param(cst.Name("params")),
                         star_kwarg=cst.Param(cst.Name("kwparams")),
@@ -239,9 +210,8 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "lambda *params, **kwparams: 5",
             ),
-            # Inner whitespace
-            (
-                cst.Lambda(
+            "inner_whitespace": (
+                lambda: cst.Lambda(
                     lpar=(cst.LeftParen(whitespace_after=cst.SimpleWhitespace(" ")),),
                     whitespace_after_lambda=cst.SimpleWhitespace("  "),
                     params=cst.Parameters(),
@@ -252,48 +222,51 @@ class LambdaCreationTest(CSTNodeTest):
                 "( lambda  : 5 )",
                 CodeRange((1, 2), (1, 13)),
             ),
-        )
+        }
     )
     def test_valid(
-        self, node: cst.CSTNode, code: str, position: Optional[CodeRange] = None
+        self,
+        get_node: Callable[[], cst.CSTNode],
+        code: str,
+        position: Optional[CodeRange] = None,
     ) -> None:
-        self.validate_node(node, code, expected_position=position)
+        self.validate_node(get_node(), code, expected_position=position)
 
     @data_provider(
-        (
-            (
+        {
+            "lpar_without_rpar": (
                 lambda: cst.Lambda(
-                    cst.Parameters(params=(cst.Param(cst.Name("arg")),)),
+                    cst.Parameters(params=_ARG_PARAMS),
                     cst.Integer("5"),
                     lpar=(cst.LeftParen(),),
                 ),
                 "left paren without right paren",
             ),
-            (
+            "rpar_without_lpar": (
                 lambda: cst.Lambda(
-                    cst.Parameters(params=(cst.Param(cst.Name("arg")),)),
+                    cst.Parameters(params=_ARG_PARAMS),
                     cst.Integer("5"),
                     rpar=(cst.RightParen(),),
                 ),
                 "right paren without left paren",
             ),
-            (
+            "posonly_param_without_whitespace_after_lambda": (
                 lambda: cst.Lambda(
-                    cst.Parameters(posonly_params=(cst.Param(cst.Name("arg")),)),
+                    cst.Parameters(posonly_params=_ARG_PARAMS),
                     cst.Integer("5"),
                     whitespace_after_lambda=cst.SimpleWhitespace(""),
                 ),
                 "at least one space after lambda",
             ),
-            (
+            "param_without_whitespace_after_lambda": (
                 lambda: cst.Lambda(
-                    cst.Parameters(params=(cst.Param(cst.Name("arg")),)),
+                    cst.Parameters(params=_ARG_PARAMS),
                     cst.Integer("5"),
                     whitespace_after_lambda=cst.SimpleWhitespace(""),
                 ),
                 "at least one space after lambda",
             ),
-            (
+            "default_param_without_whitespace_after_lambda": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         params=(cst.Param(cst.Name("arg"), default=cst.Integer("5")),)
@@ -303,7 +276,7 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "at least one space after lambda",
             ),
-            (
+            "star_kwarg_equal_without_default": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         star_kwarg=cst.Param(cst.Name("bar"), equal=cst.AssignEqual())
@@ -312,20 +285,18 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "Must have a default when specifying an AssignEqual.",
             ),
-            (
+            "star_kwarg_invalid_star": (
                 lambda: cst.Lambda(
                     cst.Parameters(star_kwarg=cst.Param(cst.Name("bar"), star="***")),
                     cst.Integer("5"),
                 ),
                 r"Must specify either '', '\*' or '\*\*' for star.",
             ),
-            (
+            "param_without_default_after_default": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
-                            cst.Param(
-                                cst.Name("bar"), default=cst.SimpleString('"one"')
-                            ),
+                            _P_BAR_ONE,
                             cst.Param(cst.Name("bar")),
                         )
                     ),
@@ -333,20 +304,20 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "Cannot have param without defaults following a param with defaults.",
             ),
-            (
+            "param_star_without_kwonly_params": (
                 lambda: cst.Lambda(
                     cst.Parameters(star_arg=cst.ParamStar()), cst.Integer("5")
                 ),
                 "Must have at least one kwonly param if ParamStar is used.",
             ),
-            (
+            "param_with_star": (
                 lambda: cst.Lambda(
                     cst.Parameters(params=(cst.Param(cst.Name("bar"), star="*"),)),
                     cst.Integer("5"),
                 ),
                 "Expecting a star prefix of ''",
             ),
-            (
+            "default_param_with_star": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
@@ -361,7 +332,7 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "Expecting a star prefix of ''",
             ),
-            (
+            "kwonly_param_with_star": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         kwonly_params=(cst.Param(cst.Name("bar"), star="*"),)
@@ -370,21 +341,21 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "Expecting a star prefix of ''",
             ),
-            (
+            "star_arg_with_double_star": (
                 lambda: cst.Lambda(
                     cst.Parameters(star_arg=cst.Param(cst.Name("bar"), star="**")),
                     cst.Integer("5"),
                 ),
                 r"Expecting a star prefix of '\*'",
             ),
-            (
+            "star_kwarg_with_single_star": (
                 lambda: cst.Lambda(
                     cst.Parameters(star_kwarg=cst.Param(cst.Name("bar"), star="*")),
                     cst.Integer("5"),
                 ),
                 r"Expecting a star prefix of '\*\*'",
             ),
-            (
+            "annotated_posonly_param": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         posonly_params=(
@@ -399,7 +370,7 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "Lambda params cannot have type annotations",
             ),
-            (
+            "annotated_param": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
@@ -414,7 +385,7 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "Lambda params cannot have type annotations",
             ),
-            (
+            "annotated_default_param": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
@@ -430,7 +401,7 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "Lambda params cannot have type annotations",
             ),
-            (
+            "annotated_star_arg": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         star_arg=cst.Param(
@@ -442,7 +413,7 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "Lambda params cannot have type annotations",
             ),
-            (
+            "annotated_kwonly_param": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         kwonly_params=(
@@ -457,7 +428,7 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "Lambda params cannot have type annotations",
             ),
-            (
+            "annotated_star_kwarg": (
                 lambda: cst.Lambda(
                     cst.Parameters(
                         star_kwarg=cst.Param(
@@ -469,7 +440,7 @@ class LambdaCreationTest(CSTNodeTest):
                 ),
                 "Lambda params cannot have type annotations",
             ),
-        )
+        }
     )
     def test_invalid(
         self, get_node: Callable[[], cst.CSTNode], expected_re: str
@@ -485,12 +456,13 @@ def _parse_expression_force_38(code: str) -> cst.BaseExpression:
 
 class LambdaParserTest(CSTNodeTest):
     @data_provider(
-        (
-            # Simple lambda
-            (cst.Lambda(cst.Parameters(), cst.Integer("5")), "lambda: 5"),
-            # Test basic positional params
-            (
-                cst.Lambda(
+        {
+            "simple_lambda": (
+                lambda: cst.Lambda(cst.Parameters(), cst.Integer("5")),
+                "lambda: 5",
+            ),
+            "params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(
@@ -508,9 +480,8 @@ class LambdaParserTest(CSTNodeTest):
                 ),
                 "lambda bar, baz: 5",
             ),
-            # Test basic positional default params
-            (
-                cst.Lambda(
+            "default_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(
@@ -535,9 +506,8 @@ class LambdaParserTest(CSTNodeTest):
                 ),
                 'lambda bar = "one", baz = 5: 5',
             ),
-            # Mixed positional and default params.
-            (
-                cst.Lambda(
+            "mixed_params_and_default_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(
@@ -560,9 +530,8 @@ class LambdaParserTest(CSTNodeTest):
                 ),
                 "lambda bar, baz = 5: 5",
             ),
-            # Test kwonly params
-            (
-                cst.Lambda(
+            "kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         star_arg=cst.ParamStar(),
                         kwonly_params=(
@@ -583,9 +552,8 @@ class LambdaParserTest(CSTNodeTest):
                 ),
                 'lambda *, bar = "one", baz: 5',
             ),
-            # Mixed params and kwonly_params
-            (
-                cst.Lambda(
+            "params_and_kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(
@@ -604,44 +572,20 @@ class LambdaParserTest(CSTNodeTest):
                             ),
                         ),
                         star_arg=cst.ParamStar(),
-                        kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"),
-                                default=cst.SimpleString('"one"'),
-                                equal=cst.AssignEqual(),
-                                star="",
-                                comma=cst.Comma(
-                                    whitespace_after=cst.SimpleWhitespace(" ")
-                                ),
-                            ),
-                            cst.Param(
-                                cst.Name("baz"),
-                                star="",
-                                comma=cst.Comma(
-                                    whitespace_after=cst.SimpleWhitespace(" ")
-                                ),
-                            ),
-                            cst.Param(
-                                cst.Name("biz"),
-                                default=cst.SimpleString('"two"'),
-                                equal=cst.AssignEqual(),
-                                star="",
-                            ),
-                        ),
+                        kwonly_params=_PARSED_KWONLY_PARAMS,
                     ),
                     cst.Integer("5"),
                     whitespace_after_lambda=cst.SimpleWhitespace(" "),
                 ),
                 'lambda first, second, *, bar = "one", baz, biz = "two": 5',
             ),
-            # Mixed params and kwonly_params
-            (
-                cst.Lambda(
+            "default_params_and_kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(
                                 cst.Name("first"),
-                                default=cst.Float("1.0"),
+                                default=_ONE_POINT_ZERO,
                                 equal=cst.AssignEqual(),
                                 star="",
                                 comma=cst.Comma(
@@ -650,7 +594,7 @@ class LambdaParserTest(CSTNodeTest):
                             ),
                             cst.Param(
                                 cst.Name("second"),
-                                default=cst.Float("1.5"),
+                                default=_ONE_POINT_FIVE,
                                 equal=cst.AssignEqual(),
                                 star="",
                                 comma=cst.Comma(
@@ -659,39 +603,15 @@ class LambdaParserTest(CSTNodeTest):
                             ),
                         ),
                         star_arg=cst.ParamStar(),
-                        kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"),
-                                default=cst.SimpleString('"one"'),
-                                equal=cst.AssignEqual(),
-                                star="",
-                                comma=cst.Comma(
-                                    whitespace_after=cst.SimpleWhitespace(" ")
-                                ),
-                            ),
-                            cst.Param(
-                                cst.Name("baz"),
-                                star="",
-                                comma=cst.Comma(
-                                    whitespace_after=cst.SimpleWhitespace(" ")
-                                ),
-                            ),
-                            cst.Param(
-                                cst.Name("biz"),
-                                default=cst.SimpleString('"two"'),
-                                equal=cst.AssignEqual(),
-                                star="",
-                            ),
-                        ),
+                        kwonly_params=_PARSED_KWONLY_PARAMS,
                     ),
                     cst.Integer("5"),
                     whitespace_after_lambda=cst.SimpleWhitespace(" "),
                 ),
                 'lambda first = 1.0, second = 1.5, *, bar = "one", baz, biz = "two": 5',
             ),
-            # Mixed params and kwonly_params
-            (
-                cst.Lambda(
+            "mixed_params_and_kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(
@@ -710,7 +630,7 @@ class LambdaParserTest(CSTNodeTest):
                             ),
                             cst.Param(
                                 cst.Name("third"),
-                                default=cst.Float("1.0"),
+                                default=_ONE_POINT_ZERO,
                                 equal=cst.AssignEqual(),
                                 star="",
                                 comma=cst.Comma(
@@ -719,7 +639,7 @@ class LambdaParserTest(CSTNodeTest):
                             ),
                             cst.Param(
                                 cst.Name("fourth"),
-                                default=cst.Float("1.5"),
+                                default=_ONE_POINT_FIVE,
                                 equal=cst.AssignEqual(),
                                 star="",
                                 comma=cst.Comma(
@@ -728,87 +648,38 @@ class LambdaParserTest(CSTNodeTest):
                             ),
                         ),
                         star_arg=cst.ParamStar(),
-                        kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"),
-                                default=cst.SimpleString('"one"'),
-                                equal=cst.AssignEqual(),
-                                star="",
-                                comma=cst.Comma(
-                                    whitespace_after=cst.SimpleWhitespace(" ")
-                                ),
-                            ),
-                            cst.Param(
-                                cst.Name("baz"),
-                                star="",
-                                comma=cst.Comma(
-                                    whitespace_after=cst.SimpleWhitespace(" ")
-                                ),
-                            ),
-                            cst.Param(
-                                cst.Name("biz"),
-                                default=cst.SimpleString('"two"'),
-                                equal=cst.AssignEqual(),
-                                star="",
-                            ),
-                        ),
+                        kwonly_params=_PARSED_KWONLY_PARAMS,
                     ),
                     cst.Integer("5"),
                     whitespace_after_lambda=cst.SimpleWhitespace(" "),
                 ),
                 'lambda first, second, third = 1.0, fourth = 1.5, *, bar = "one", baz, biz = "two": 5',
             ),
-            # Test star_arg
-            (
-                cst.Lambda(
+            "star_arg": (
+                lambda: cst.Lambda(
                     cst.Parameters(star_arg=cst.Param(cst.Name("params"), star="*")),
                     cst.Integer("5"),
                     whitespace_after_lambda=cst.SimpleWhitespace(" "),
                 ),
                 "lambda *params: 5",
             ),
-            # Typed star_arg, include kwonly_params
-            (
-                cst.Lambda(
+            "star_arg_and_kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         star_arg=cst.Param(
                             cst.Name("params"),
                             star="*",
                             comma=cst.Comma(whitespace_after=cst.SimpleWhitespace(" ")),
                         ),
-                        kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"),
-                                default=cst.SimpleString('"one"'),
-                                equal=cst.AssignEqual(),
-                                star="",
-                                comma=cst.Comma(
-                                    whitespace_after=cst.SimpleWhitespace(" ")
-                                ),
-                            ),
-                            cst.Param(
-                                cst.Name("baz"),
-                                star="",
-                                comma=cst.Comma(
-                                    whitespace_after=cst.SimpleWhitespace(" ")
-                                ),
-                            ),
-                            cst.Param(
-                                cst.Name("biz"),
-                                default=cst.SimpleString('"two"'),
-                                equal=cst.AssignEqual(),
-                                star="",
-                            ),
-                        ),
+                        kwonly_params=_PARSED_KWONLY_PARAMS,
                     ),
                     cst.Integer("5"),
                     whitespace_after_lambda=cst.SimpleWhitespace(" "),
                 ),
                 'lambda *params, bar = "one", baz, biz = "two": 5',
             ),
-            # Mixed params, star_arg and kwonly_params
-            (
-                cst.Lambda(
+            "mixed_params_star_arg_and_kwonly_params": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         params=(
                             cst.Param(
@@ -827,7 +698,7 @@ class LambdaParserTest(CSTNodeTest):
                             ),
                             cst.Param(
                                 cst.Name("third"),
-                                default=cst.Float("1.0"),
+                                default=_ONE_POINT_ZERO,
                                 equal=cst.AssignEqual(),
                                 star="",
                                 comma=cst.Comma(
@@ -836,7 +707,7 @@ class LambdaParserTest(CSTNodeTest):
                             ),
                             cst.Param(
                                 cst.Name("fourth"),
-                                default=cst.Float("1.5"),
+                                default=_ONE_POINT_FIVE,
                                 equal=cst.AssignEqual(),
                                 star="",
                                 comma=cst.Comma(
@@ -849,39 +720,15 @@ class LambdaParserTest(CSTNodeTest):
                             star="*",
                             comma=cst.Comma(whitespace_after=cst.SimpleWhitespace(" ")),
                         ),
-                        kwonly_params=(
-                            cst.Param(
-                                cst.Name("bar"),
-                                default=cst.SimpleString('"one"'),
-                                equal=cst.AssignEqual(),
-                                star="",
-                                comma=cst.Comma(
-                                    whitespace_after=cst.SimpleWhitespace(" ")
-                                ),
-                            ),
-                            cst.Param(
-                                cst.Name("baz"),
-                                star="",
-                                comma=cst.Comma(
-                                    whitespace_after=cst.SimpleWhitespace(" ")
-                                ),
-                            ),
-                            cst.Param(
-                                cst.Name("biz"),
-                                default=cst.SimpleString('"two"'),
-                                equal=cst.AssignEqual(),
-                                star="",
-                            ),
-                        ),
+                        kwonly_params=_PARSED_KWONLY_PARAMS,
                     ),
                     cst.Integer("5"),
                     whitespace_after_lambda=cst.SimpleWhitespace(" "),
                 ),
                 'lambda first, second, third = 1.0, fourth = 1.5, *params, bar = "one", baz, biz = "two": 5',
             ),
-            # Test star_arg and star_kwarg
-            (
-                cst.Lambda(
+            "star_kwarg": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         star_kwarg=cst.Param(cst.Name("kwparams"), star="**")
                     ),
@@ -890,9 +737,8 @@ class LambdaParserTest(CSTNodeTest):
                 ),
                 "lambda **kwparams: 5",
             ),
-            # Test star_arg and kwarg
-            (
-                cst.Lambda(
+            "star_arg_and_star_kwarg": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         star_arg=cst.Param(
                             cst.Name("params"),
@@ -906,9 +752,8 @@ class LambdaParserTest(CSTNodeTest):
                 ),
                 "lambda *params, **kwparams: 5",
             ),
-            # Inner whitespace
-            (
-                cst.Lambda(
+            "inner_whitespace": (
+                lambda: cst.Lambda(
                     lpar=(cst.LeftParen(whitespace_after=cst.SimpleWhitespace(" ")),),
                     params=cst.Parameters(),
                     colon=cst.Colon(
@@ -920,25 +765,24 @@ class LambdaParserTest(CSTNodeTest):
                 ),
                 "( lambda  : 5 )",
             ),
-            # No space between lambda and params
-            (
-                cst.Lambda(
+            "star_arg_without_whitespace_after_lambda": (
+                lambda: cst.Lambda(
                     cst.Parameters(star_arg=cst.Param(cst.Name("args"), star="*")),
                     cst.Integer("5"),
                     whitespace_after_lambda=cst.SimpleWhitespace(""),
                 ),
                 "lambda*args: 5",
             ),
-            (
-                cst.Lambda(
+            "star_kwarg_without_whitespace_after_lambda": (
+                lambda: cst.Lambda(
                     cst.Parameters(star_kwarg=cst.Param(cst.Name("kwargs"), star="**")),
                     cst.Integer("5"),
                     whitespace_after_lambda=cst.SimpleWhitespace(""),
                 ),
                 "lambda**kwargs: 5",
             ),
-            (
-                cst.Lambda(
+            "param_star_without_whitespace_after_lambda": (
+                lambda: cst.Lambda(
                     cst.Parameters(
                         star_arg=cst.ParamStar(
                             comma=cst.Comma(
@@ -952,8 +796,8 @@ class LambdaParserTest(CSTNodeTest):
                 ),
                 "lambda*,args: 5",
             ),
-            (
-                cst.ListComp(
+            "lambda_in_list_comp": (
+                lambda: cst.ListComp(
                     elt=cst.Lambda(
                         params=cst.Parameters(),
                         body=cst.Tuple(()),
@@ -967,18 +811,20 @@ class LambdaParserTest(CSTNodeTest):
                 ),
                 "[lambda:()for _ in _]",
             ),
-        )
+        }
     )
     def test_valid(
-        self, node: cst.CSTNode, code: str, position: Optional[CodeRange] = None
+        self,
+        get_node: Callable[[], cst.CSTNode],
+        code: str,
+        position: Optional[CodeRange] = None,
     ) -> None:
-        self.validate_node(node, code, parse_expression, position)
+        self.validate_node(get_node(), code, parse_expression, position)
 
     @data_provider(
-        (
-            # Test basic positional only params
-            {
-                "node": cst.Lambda(
+        {
+            "posonly_params": {
+                "get_node": lambda: cst.Lambda(
                     cst.Parameters(
                         posonly_params=(
                             cst.Param(
@@ -1003,9 +849,12 @@ class LambdaParserTest(CSTNodeTest):
                 ),
                 "code": "lambda bar, baz, /: 5",
             },
-        )
+        }
     )
     def test_valid_38(
-        self, node: cst.CSTNode, code: str, position: Optional[CodeRange] = None
+        self,
+        get_node: Callable[[], cst.CSTNode],
+        code: str,
+        position: Optional[CodeRange] = None,
     ) -> None:
-        self.validate_node(node, code, _parse_expression_force_38, position)
+        self.validate_node(get_node(), code, _parse_expression_force_38, position)
@@ -4,7 +4,7 @@
 # LICENSE file in the root directory of this source tree.
 
 import re
-from functools import lru_cache
+from functools import cache, lru_cache
 from typing import FrozenSet, Iterator, Mapping, Optional, Tuple, Union
 
 from libcst._parser.conversions.expression import (
@@ -296,7 +296,7 @@ def get_grammar(
     return generate_grammar(get_grammar_str(version, future_imports), PythonTokenTypes)
 
 
-@lru_cache()
+@cache
 def get_terminal_conversions() -> Mapping[str, TerminalConversion]:
     """
     Returns a mapping from terminal type name to the conversion function that should be
@@ -309,7 +309,7 @@ def get_terminal_conversions() -> Mapping[str, TerminalConversion]:
     }
 
 
-@lru_cache()
+@cache
 def validate_grammar() -> None:
     for fn in _NONTERMINAL_CONVERSIONS_SEQUENCE:
         fn_productions = get_productions(fn)
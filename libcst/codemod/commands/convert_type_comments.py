@@ -9,43 +9,67 @@ import builtins
 import dataclasses
 import functools
 import sys
-from typing import cast, Dict, List, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    cast,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import libcst as cst
 import libcst.matchers as m
 from libcst.codemod import CodemodContext, VisitorBasedCodemodCommand
 
+if sys.version_info < (3, 9):
+    # The ast module did not get `unparse` until Python 3.9,
+    # or `type_comments` until Python 3.8
+    #
+    # For earlier versions of python, raise at import time instead of failing
+    # later. It might be possible to use libcst parsing and the typed_ast
+    # library to support earlier python versions, but this is not a high
+    # priority.
+    raise NotImplementedError(
+        "You are trying to run ConvertTypeComments, but libcst "
+        + "needs to be running with Python 3.9+ in order to "
+        + "do this. Try using Python 3.9+ to run your codemod. "
+        + "Note that the target code can be using Python 3.6+, "
+        + "it is only libcst that needs a new Python version."
+    )
 
-@functools.lru_cache()
-def _empty_module() -> cst.Module:
-    return cst.parse_module("")
-
+_BUILTINS: FrozenSet[str] = frozenset(dir(builtins))
 
-def _code_for_node(node: cst.CSTNode) -> str:
-    return _empty_module().code_for_node(node)
+_EMPTY_MODULE: cst.Module = cst.parse_module("")
 
 
-def _ast_for_statement(node: cst.CSTNode) -> ast.stmt:
+def _ast_for_statement(node: cst.CSTNode) -> Optional[ast.stmt]:
     """
     Get the type-comment-enriched python AST for a node.
 
     If there are illegal type comments, this can return a SyntaxError.
-    In that case, return the same node with no type comments (which will
-    cause this codemod to ignore it).
+    In that case, return None (which will cause this codemod to ignore
+    the node) rather than paying for a second parse without type comments.
     """
-    code = _code_for_node(node)
     try:
-        return ast.parse(code, type_comments=True).body[-1]
+        return ast.parse(_EMPTY_MODULE.code_for_node(node), type_comments=True).body[-1]
     except SyntaxError:
-        return ast.parse(code, type_comments=False).body[-1]
+        return None
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_type_comment(
     type_comment: Optional[str],
 ) -> Optional[ast.expr]:
     """
     Attempt to parse a type comment. If it is None or if it fails to parse,
     return None.
+
+    The same few type comments tend to recur across a codebase, so results
+    are memoized. The returned AST must be treated as read-only.
     """
     if type_comment is None:
         return None
@@ -55,27 +79,83 @@ def _parse_type_comment(
         return None
 
 
+def _may_have_ast_type_comment(comment: Optional[cst.Comment]) -> bool:
+    """
+    Determine whether `ast` would attach a libcst comment to its statement as
+    a type comment.
+
+    This mirrors how the CPython tokenizer recognizes type comments: a `#`,
+    optional spaces or tabs, `type:`, optional spaces or tabs, and then
+    anything other than a `type: ignore` directive (`ignore` followed by the
+    end of the comment or by a non-alphanumeric ASCII character). It has to
+    agree with the tokenizer exactly, since it decides which statements we
+    hand to `ast` at all. `_is_type_comment` deliberately keeps its looser
+    rule, because it only decides which comments to strip.
+    """
+    if comment is None:
+        return False
+    value = comment.value[1:].lstrip(" \t")
+    if not value.startswith("type:"):
+        return False
+    value = value[5:].lstrip(" \t")
+    return not (
+        value.startswith("ignore")
+        and (len(value) == 6 or (value[6].isascii() and not value[6].isalnum()))
+    )
+
+
+def _has_type_comment_marker(node: cst.CSTNode) -> bool:
+    """
+    Cheaply check whether a statement could carry a type comment, so that we
+    can skip rendering and parsing the (usually large) majority of statements
+    which have none.
+
+    The `ast` module only attaches a statement's type comment if it trails the
+    line (or, for a compound statement, its header), so that is the only
+    comment we need to look at.
+    """
+    if isinstance(node, cst.SimpleStatementLine):
+        return _may_have_ast_type_comment(node.trailing_whitespace.comment)
+    if isinstance(node, (cst.For, cst.With)) and isinstance(
+        node.body, cst.IndentedBlock
+    ):
+        return _may_have_ast_type_comment(node.body.header.comment)
+    return True
+
+
 def _annotation_for_statement(
     node: cst.CSTNode,
 ) -> Optional[ast.expr]:
-    return _parse_type_comment(_ast_for_statement(node).type_comment)
+    # Statements that do have a type comment still go through `ast`, which
+    # also validates any other type comments inside them: if one of them is
+    # illegal, the whole statement is skipped.
+    if not _has_type_comment_marker(node):
+        return None
+    node_ast = _ast_for_statement(node)
+    if node_ast is None:
+        return None
+    return _parse_type_comment(node_ast.type_comment)
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_func_type_comment(
     func_type_comment: Optional[str],
-) -> Optional["ast.FunctionType"]:
+) -> Optional[Tuple[Tuple[str, ...], str]]:
+    """
+    Parse a function type comment into the unparsed source of its argument
+    types and of its return type. If it is None, return None. If it fails to
+    parse, raise a SyntaxError.
+
+    Function signatures tend to recur across a codebase, so results are
+    memoized, which saves both the parse and the `ast.unparse` calls.
+    """
     if func_type_comment is None:
         return None
-    return ast.parse(func_type_comment, "<func_type_comment>", "func_type")
-
-
-@functools.lru_cache()
-def _builtins() -> Set[str]:
-    return set(dir(builtins))
-
-
-def _is_builtin(annotation: str) -> bool:
-    return annotation in _builtins()
+    func_type = ast.parse(func_type_comment, "<func_type_comment>", "func_type")
+    return (
+        tuple(ast.unparse(argtype) for argtype in func_type.argtypes),
+        ast.unparse(func_type.returns),
+    )
 
 
 def _convert_annotation(
@@ -91,7 +171,7 @@ def _convert_annotation(
     on legacy code where type comments may well include invalid types
     that would crash at runtime.
     """
-    if _is_builtin(raw):
+    if raw in _BUILTINS:
         return cst.Annotation(annotation=cst.Name(value=raw))
     if not quote_annotations:
         try:
@@ -111,13 +191,16 @@ def _is_type_comment(comment: Optional[cst.Comment]) -> bool:
     """
     if comment is None:
         return False
-    value = comment.value[1:].strip()
-    if not value.startswith("type:"):
-        return False
-    suffix = value.removeprefix("type:").strip().split()
-    if len(suffix) > 0 and suffix[0] == "ignore":
+    head, sep, suffix = comment.value[1:].partition("type:")
+    if not sep or head.strip():
         return False
-    return True
+    # A `type: ignore` directive is not a type comment. Check the first word
+    # in place rather than splitting the whole comment into words. Unlike
+    # `_may_have_ast_type_comment`, this need not match the tokenizer exactly.
+    suffix = suffix.lstrip()
+    return not (
+        suffix.startswith("ignore") and (len(suffix) == 6 or suffix[6].isspace())
+    )
 
 
 def _strip_type_comment(comment: Optional[cst.Comment]) -> Optional[cst.Comment]:
@@ -141,8 +224,10 @@ class _ArityError(Exception):
     pass
 
 
-UnpackedBindings = Union[cst.BaseExpression, List["UnpackedBindings"]]
-UnpackedAnnotations = Union[str, List["UnpackedAnnotations"]]
+# Nested structures are represented as tuples, so that they can be told apart
+# from leaves with a cheap `type(x) is tuple` check.
+UnpackedBindings = Union[cst.BaseExpression, Tuple["UnpackedBindings", ...]]
+UnpackedAnnotations = Union[str, Tuple["UnpackedAnnotations", ...]]
 TargetAnnotationPair = Tuple[cst.BaseExpression, str]
 
 
@@ -157,9 +242,9 @@ class AnnotationSpreader:
         expression: ast.expr,
     ) -> UnpackedAnnotations:
         if isinstance(expression, ast.Tuple):
-            return [
+            return tuple(
                 AnnotationSpreader.unpack_annotation(elt) for elt in expression.elts
-            ]
+            )
         else:
             return ast.unparse(expression)
 
@@ -176,37 +261,46 @@ class AnnotationSpreader:
         analysis that is the safest option for codemods.
         """
         if isinstance(target, cst.Tuple):
-            return [
+            return tuple(
                 AnnotationSpreader.unpack_target(element.value)
                 for element in target.elements
-            ]
+            )
         else:
             return target
 
+    @staticmethod
+    def iter_annotated_bindings(
+        bindings: UnpackedBindings,
+        annotations: UnpackedAnnotations,
+    ) -> Iterator[Tuple[cst.BaseAssignTargetExpression, str]]:
+        # Walk the (bindings, annotations) pairs with an explicit stack
+        # rather than recursing, pushing children in reverse so that the
+        # flattened result stays in source order.
+        stack: List[Tuple[UnpackedBindings, UnpackedAnnotations]] = [
+            (bindings, annotations)
+        ]
+        while stack:
+            binding, annotation = stack.pop()
+            if type(annotation) is tuple:
+                if type(binding) is tuple and len(binding) == len(annotation):
+                    # The arities match, so we visit each pair.
+                    stack.extend(zip(reversed(binding), reversed(annotation)))
+                else:
+                    # Either mismatched lengths, or multi-type and one-target
+                    raise _ArityError()
+            elif type(binding) is tuple:
+                # multi-target and one-type
+                raise _ArityError()
+            else:
+                assert isinstance(binding, cst.BaseAssignTargetExpression)
+                yield (binding, cast(str, annotation))
+
     @staticmethod
     def annotated_bindings(
         bindings: UnpackedBindings,
         annotations: UnpackedAnnotations,
     ) -> List[Tuple[cst.BaseAssignTargetExpression, str]]:
-        if isinstance(annotations, list):
-            if isinstance(bindings, list) and len(bindings) == len(annotations):
-                # The arities match, so we return the flattened result of
-                # mapping annotated_bindings over each pair.
-                out: List[Tuple[cst.BaseAssignTargetExpression, str]] = []
-                for binding, annotation in zip(bindings, annotations):
-                    out.extend(
-                        AnnotationSpreader.annotated_bindings(binding, annotation)
-                    )
-                return out
-            else:
-                # Either mismatched lengths, or multi-type and one-target
-                raise _ArityError()
-        elif isinstance(bindings, list):
-            # multi-target and one-type
-            raise _ArityError()
-        else:
-            assert isinstance(bindings, cst.BaseAssignTargetExpression)
-            return [(bindings, annotations)]
+        return list(AnnotationSpreader.iter_annotated_bindings(bindings, annotations))
 
     @staticmethod
     def type_declaration(
@@ -230,24 +324,27 @@ class AnnotationSpreader:
         leading_lines: Sequence[cst.EmptyLine],
         quote_annotations: bool,
     ) -> List[cst.SimpleStatementLine]:
-        return [
-            cst.SimpleStatementLine(
-                body=[
-                    AnnotationSpreader.type_declaration(
-                        binding=binding,
-                        raw_annotation=raw_annotation,
-                        quote_annotations=quote_annotations,
-                    )
-                ],
-                leading_lines=leading_lines if i == 0 else [],
-            )
-            for i, (binding, raw_annotation) in enumerate(
-                AnnotationSpreader.annotated_bindings(
-                    bindings=bindings,
-                    annotations=annotations,
+        # Build the statements while flattening the bindings, rather than
+        # materializing the flattened bindings first.
+        statements: List[cst.SimpleStatementLine] = []
+        for binding, raw_annotation in AnnotationSpreader.iter_annotated_bindings(
+            bindings=bindings,
+            annotations=annotations,
+        ):
+            statements.append(
+                cst.SimpleStatementLine(
+                    body=[
+                        AnnotationSpreader.type_declaration(
+                            binding=binding,
+                            raw_annotation=raw_annotation,
+                            quote_annotations=quote_annotations,
+                        )
+                    ],
+                    # Only the first declaration keeps the leading lines.
+                    leading_lines=leading_lines if not statements else [],
                 )
             )
-        ]
+        return statements
 
 
 def convert_Assign(
@@ -305,6 +402,19 @@ def convert_Assign(
         ]
 
 
+def _iter_args(arguments: ast.arguments) -> Iterator[ast.arg]:
+    """
+    Iterate over all the parameters of a function in positional order.
+    """
+    yield from arguments.posonlyargs
+    yield from arguments.args
+    if arguments.vararg is not None:
+        yield arguments.vararg
+    yield from arguments.kwonlyargs
+    if arguments.kwarg is not None:
+        yield arguments.kwarg
+
+
 @dataclasses.dataclass(frozen=True)
 class FunctionTypeInfo:
     arguments: Dict[str, Optional[str]]
@@ -325,27 +435,10 @@ class FunctionTypeInfo:
 
         To understand edge case behavior see the `leave_FunctionDef` docstring.
         """
-        node_ast = cast(ast.FunctionDef, _ast_for_statement(node_cst))
-        # Note: this is guaranteed to have the correct arity.
-        args = [
-            *node_ast.args.posonlyargs,
-            *node_ast.args.args,
-            *(
-                []
-                if node_ast.args.vararg is None
-                else [
-                    node_ast.args.vararg,
-                ]
-            ),
-            *node_ast.args.kwonlyargs,
-            *(
-                []
-                if node_ast.args.kwarg is None
-                else [
-                    node_ast.args.kwarg,
-                ]
-            ),
-        ]
+        node_ast = cast(Optional[ast.FunctionDef], _ast_for_statement(node_cst))
+        if node_ast is None:
+            # On illegal type comments, ignore type information
+            return cls({}, None)
         try:
             func_type_annotation = _parse_func_type_comment(node_ast.type_comment)
         except SyntaxError:
@@ -355,49 +448,36 @@ class FunctionTypeInfo:
             return cls(
                 arguments={
                     arg.arg: arg.type_comment
-                    for arg in args
+                    for arg in _iter_args(node_ast.args)
                     if arg.type_comment is not None
                 },
                 returns=None,
             )
         else:
-            argtypes = func_type_annotation.argtypes
-            returns = ast.unparse(func_type_annotation.returns)
-            if (
-                len(argtypes) == 1
-                and isinstance(argtypes[0], ast.Constant)
-                # pyre-ignore [16] Pyre cannot refine constant indexes (yet!)
-                and argtypes[0].value is Ellipsis
-            ):
+            argtypes, returns = func_type_annotation
+            if argtypes == ("...",):
                 # Only use the return type if the comment was like `(...) -> R`
-                return cls(
-                    arguments={arg.arg: arg.type_comment for arg in args},
-                    returns=returns,
-                )
-            elif len(argtypes) == len(args):
-                # Merge the type comments, preferring inline comments where available
                 return cls(
                     arguments={
-                        arg.arg: arg.type_comment or ast.unparse(from_func_type)
-                        for arg, from_func_type in zip(args, argtypes)
+                        arg.arg: arg.type_comment for arg in _iter_args(node_ast.args)
                     },
                     returns=returns,
                 )
-            elif is_method and len(argtypes) == len(args) - 1:
-                # Merge as above, but skip merging the initial `self` or `cls` arg.
-                return cls(
-                    arguments={
-                        args[0].arg: args[0].type_comment,
-                        **{
-                            arg.arg: arg.type_comment or ast.unparse(from_func_type)
-                            for arg, from_func_type in zip(args[1:], argtypes)
-                        },
-                    },
-                    returns=returns,
-                )
-            else:
+            # Note: this is guaranteed to have the correct arity.
+            args = list(_iter_args(node_ast.args))
+            arguments: Dict[str, Optional[str]] = {}
+            if is_method and len(argtypes) == len(args) - 1:
+                # Don't merge the initial `self` or `cls` arg, which the
+                # function type comment omitted.
+                arguments[args[0].arg] = args[0].type_comment
+                args = args[1:]
+            elif len(argtypes) != len(args):
                 # On arity mismatches, ignore the type information
                 return cls({}, None)
+            # Merge the type comments, preferring inline comments where available
+            for arg, from_func_type in zip(args, argtypes):
+                arguments[arg.arg] = arg.type_comment or from_func_type
+            return cls(arguments=arguments, returns=returns)
 
 
 class ConvertTypeComments(VisitorBasedCodemodCommand):
@@ -465,8 +545,12 @@ class ConvertTypeComments(VisitorBasedCodemodCommand):
     #
     # This state handles tracking everything we need for this.
     function_type_info_stack: List[FunctionTypeInfo]
+    function_arguments_stack: List[Dict[str, Optional[str]]]
     function_body_stack: List[cst.BaseSuite]
     aggressively_strip_type_comments: bool
+    # How many ClassDefs we are nested inside, which tells us whether a
+    # FunctionDef is a method.
+    class_def_depth: int
 
     @staticmethod
     def add_args(arg_parser: argparse.ArgumentParser) -> None:
@@ -484,28 +568,15 @@ class ConvertTypeComments(VisitorBasedCodemodCommand):
         context: CodemodContext,
         no_quote_annotations: bool = False,
     ) -> None:
-        if (sys.version_info.major, sys.version_info.minor) < (3, 9):
-            # The ast module did not get `unparse` until Python 3.9,
-            # or `type_comments` until Python 3.8
-            #
-            # For earlier versions of python, raise early instead of failing
-            # later. It might be possible to use libcst parsing and the
-            # typed_ast library to support earlier python versions, but this is
-            # not a high priority.
-            raise NotImplementedError(
-                "You are trying to run ConvertTypeComments, but libcst "
-                + "needs to be running with Python 3.9+ in order to "
-                + "do this. Try using Python 3.9+ to run your codemod. "
-                + "Note that the target code can be using Python 3.6+, "
-                + "it is only libcst that needs a new Python version."
-            )
         super().__init__(context)
         # flags used to control overall behavior
         self.quote_annotations: bool = not no_quote_annotations
         # state used to manage how we traverse nodes in various contexts
         self.function_type_info_stack = []
+        self.function_arguments_stack = []
         self.function_body_stack = []
         self.aggressively_strip_type_comments = False
+        self.class_def_depth = 0
 
     def _strip_TrailingWhitespace(
         self,
@@ -708,10 +779,23 @@ class ConvertTypeComments(VisitorBasedCodemodCommand):
     # it. So we accept either approach when interpreting type comments on
     # non-static methods: the first argument an have a type provided or not.
 
-    def _visit_FunctionDef(
+    def visit_ClassDef(
+        self,
+        node: cst.ClassDef,
+    ) -> None:
+        self.class_def_depth += 1
+
+    def leave_ClassDef(
+        self,
+        original_node: cst.ClassDef,
+        updated_node: cst.ClassDef,
+    ) -> cst.ClassDef:
+        self.class_def_depth -= 1
+        return updated_node
+
+    def visit_FunctionDef(
         self,
         node: cst.FunctionDef,
-        is_method: bool,
     ) -> None:
         """
         Set up the data we need to handle function definitions:
@@ -720,36 +804,22 @@ class ConvertTypeComments(VisitorBasedCodemodCommand):
           remain until we use it in `leave_FunctionDef`
         - Set that we are aggressively stripping type comments, which will
           remain true until we visit the body.
+
+        We track whether we are inside a class with a plain counter rather
+        than with matcher decorators, which would evaluate matchers against
+        every node in the module.
         """
+        is_method = self.class_def_depth > 0 and not any(
+            m.matches(d.decorator, m.Name("staticmethod")) for d in node.decorators
+        )
         function_type_info = FunctionTypeInfo.from_cst(node, is_method=is_method)
         self.aggressively_strip_type_comments = not function_type_info.is_empty()
         self.function_type_info_stack.append(function_type_info)
+        # `leave_Param` only needs the arguments, so keep them on their own
+        # stack to make the per-parameter lookup as cheap as possible.
+        self.function_arguments_stack.append(function_type_info.arguments)
         self.function_body_stack.append(node.body)
 
-    @m.call_if_not_inside(m.ClassDef())
-    @m.visit(m.FunctionDef())
-    def visit_method(
-        self,
-        node: cst.FunctionDef,
-    ) -> None:
-        return self._visit_FunctionDef(
-            node=node,
-            is_method=False,
-        )
-
-    @m.call_if_inside(m.ClassDef())
-    @m.visit(m.FunctionDef())
-    def visit_function(
-        self,
-        node: cst.FunctionDef,
-    ) -> None:
-        return self._visit_FunctionDef(
-            node=node,
-            is_method=not any(
-                m.matches(d.decorator, m.Name("staticmethod")) for d in node.decorators
-            ),
-        )
-
     def leave_TrailingWhitespace(
         self,
         original_node: cst.TrailingWhitespace,
@@ -807,16 +877,17 @@ class ConvertTypeComments(VisitorBasedCodemodCommand):
         first_statement = updated_node.body[0]
         if not hasattr(first_statement, "leading_lines"):
             return updated_node
+        # pyre-ignore[16]: we refined via `hasattr`
+        leading_lines = first_statement.leading_lines
+        filtered_leading_lines = [
+            line for line in leading_lines if not _is_type_comment(line.comment)
+        ]
+        if len(filtered_leading_lines) == len(leading_lines):
+            # Nothing was stripped, so avoid rebuilding the body.
+            return updated_node
         return updated_node.with_changes(
             body=[
-                first_statement.with_changes(
-                    leading_lines=[
-                        line
-                        # pyre-ignore[16]: we refined via `hasattr`
-                        for line in first_statement.leading_lines
-                        if not _is_type_comment(line.comment)
-                    ]
-                ),
+                first_statement.with_changes(leading_lines=filtered_leading_lines),
                 *updated_node.body[1:],
             ]
         )
@@ -834,8 +905,7 @@ class ConvertTypeComments(VisitorBasedCodemodCommand):
         if updated_node.annotation is not None:
             return updated_node
         # find out if there's a type comment and apply it if so
-        function_type_info = self.function_type_info_stack[-1]
-        raw_annotation = function_type_info.arguments.get(updated_node.name.value)
+        raw_annotation = self.function_arguments_stack[-1].get(updated_node.name.value)
         if raw_annotation is not None:
             return updated_node.with_changes(
                 annotation=_convert_annotation(
@@ -852,6 +922,7 @@ class ConvertTypeComments(VisitorBasedCodemodCommand):
         updated_node: cst.FunctionDef,
     ) -> cst.FunctionDef:
         self.function_body_stack.pop()
+        self.function_arguments_stack.pop()
         function_type_info = self.function_type_info_stack.pop()
         if updated_node.returns is None and function_type_info.returns is not None:
             return updated_node.with_changes(
@@ -204,6 +204,7 @@ class TestConvertTypeComments_AssignForWith(TestConvertTypeCommentsBase):
         before = """
             # type-ignores are not type comments
             x = 10  # type: ignore
+            y = 10  # type:ignore[assignment]
 
             # a commented type comment (per PEP 484) is not a type comment
             z = 15  # # type: int
@@ -239,10 +240,40 @@ class TestConvertTypeComments_AssignForWith(TestConvertTypeCommentsBase):
             # skip it. Here, annotating the inner `pass` is illegal.
             for x in []: # type: int
                 pass # type: None
+
+            # The same applies to assignments spanning brackets: the inner
+            # type comment is illegal, so the trailing one is not used either.
+            t = (1,  # type: int
+                 2)  # type: Tuple[int, int]
         """
         after = before
         self.assertCodemod39Plus(before, after)
 
+    def test_type_comment_spelling_follows_tokenizer(self) -> None:
+        before = """
+            # whitespace around `type:` is optional, and may be a tab
+            a = 1  #type:int
+            b = 2  # type:\tint
+
+            # `ignore` followed by a non-alphanumeric character is a type-ignore
+            c = 3  # type: ignore_foo
+
+            # but followed by an alphanumeric character it is a type
+            d = 4  # type: ignoreX
+        """
+        after = """
+            # whitespace around `type:` is optional, and may be a tab
+            a: int = 1
+            b: int = 2
+
+            # `ignore` followed by a non-alphanumeric character is a type-ignore
+            c = 3  # type: ignore_foo
+
+            # but followed by an alphanumeric character it is a type
+            d: "ignoreX" = 4
+        """
+        self.assertCodemod39Plus(before, after)
+
 
 class TestConvertTypeComments_FunctionDef(TestConvertTypeCommentsBase):
     """
@@ -7,6 +7,7 @@ import pickle
 from dataclasses import dataclass
 from typing import ClassVar
 
+import libcst as cst
 from libcst._add_slots import add_slots
 
 from libcst.testing.utils import UnitTest
@@ -44,3 +45,11 @@ class AddSlotsTest(UnitTest):
             z: bool
 
         self.assertSequenceEqual(C.__slots__, ("y",))
+
+    def test_nodes_have_no_dict(self) -> None:
+        # Trees can hold a very large number of small nodes, so every node class
+        # we export should be slotted all the way up its hierarchy.
+        for name, value in vars(cst).items():
+            if isinstance(value, type) and issubclass(value, cst.CSTNode):
+                with self.subTest(node=name):
+                    self.assertEqual(value.__dictoffset__, 0)
@@ -10,8 +10,13 @@ For Hypothesis documentation, see https://hypothesis.readthedocs.io/
 For my Python code generator, see https://pypi.org/project/hypothesmith/
 """
 
+import argparse
 import ast
+import cProfile
+import functools
 import os
+import subprocess
+import sys
 import unittest
 from datetime import timedelta
 
@@ -35,7 +40,12 @@ hypothesis.settings.load_profile("settings-for-unit-tests")
 # When the test settings stop finding new bugs, you can run `python test_fuzz.py`
 # to find more.  We turn the number of examples up, and skip the initial "reuse"
 # phase in favor of looking for new bugs... but put everything we find in the
-# database so it will be replayed next time we use the normal settings.
+# database so it will be replayed next time we use the normal settings.  Pass
+# `--jobs N` to run N fuzzing processes at once; they all share that database.
+# Pass `--profile` to write a cProfile dump to `fuzz.prof` (or `fuzz.<N>.prof`
+# per worker with `--jobs`) when the run stops; view it with
+# `python -m pstats fuzz.prof` or snakeviz, or sample the run from outside with
+# `py-spy record -- python test_fuzz.py`.
 hypothesis.settings.register_profile(
     name="settings-for-fuzzing",
     parent=hypothesis.settings.get_profile("settings-for-unit-tests"),
@@ -43,13 +53,35 @@ hypothesis.settings.register_profile(
     phases=(hypothesis.Phase.generate, hypothesis.Phase.shrink),
 )
 
+# Used only as a codegen context for rendering expressions and statements.
+_EMPTY_MODULE = libcst.Module([])
 
+# The libCST entrypoint matching each `compile()` mode.
+_PARSER_BY_MODE = {
+    "eval": libcst.parse_expression,
+    "exec": libcst.parse_module,
+    "single": libcst.parse_statement,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _compiles(source_code: str, mode: str) -> bool:
+    # Hypothesis replays the same strings many times while shrinking, so remember
+    # which ones CPython accepts rather than compiling them again.
+    try:
+        compile(source_code, "<string>", mode)
+    except Exception:
+        return False
+    return True
+
+
+# These tests are slow, so only run them when explicitly asked to.
+@unittest.skipUnless(
+    bool(os.environ.get("HYPOTHESIS", False)), "Hypothesis not requested"
+)
 class FuzzTest(unittest.TestCase):
     """Fuzz-tests based on Hypothesis and Hypothesmith."""
 
-    @unittest.skipUnless(
-        bool(os.environ.get("HYPOTHESIS", False)), "Hypothesis not requested"
-    )
     # pyre-fixme[56]: Pyre was not able to infer the type of the decorator
     #  `hypothesis.given($parameter$source_code =
     #  hypothesmith.from_grammar($parameter$start = "file_input"))`.
@@ -77,9 +109,6 @@ class FuzzTest(unittest.TestCase):
         tree = libcst.parse_module(source_code)
         self.assertEqual(source_code, tree.code)
 
-    @unittest.skipUnless(
-        bool(os.environ.get("HYPOTHESIS", False)), "Hypothesis not requested"
-    )
     # pyre-fixme[56]: Pyre was not able to infer the type of the decorator
     #  `hypothesis.given($parameter$source_code =
     #  hypothesmith.from_grammar($parameter$start = "eval_input").map(str.strip))`.
@@ -95,7 +124,7 @@ class FuzzTest(unittest.TestCase):
         try:
             tree = libcst.parse_expression(source_code)
             self.verify_identical_asts(
-                source_code, libcst.Module([]).code_for_node(tree), mode="eval"
+                source_code, _EMPTY_MODULE.code_for_node(tree), mode="eval"
             )
         except libcst.ParserSyntaxError:
             # Unlike statements, which allow us to strip trailing whitespace,
@@ -108,9 +137,6 @@ class FuzzTest(unittest.TestCase):
             # the AST.
             hypothesis.reject()
 
-    @unittest.skipUnless(
-        bool(os.environ.get("HYPOTHESIS", False)), "Hypothesis not requested"
-    )
     # pyre-fixme[56]: Pyre was not able to infer the type of the decorator
     #  `hypothesis.given($parameter$source_code =
     #  hypothesmith.from_grammar($parameter$start = "single_input").map(lambda
@@ -130,7 +156,7 @@ class FuzzTest(unittest.TestCase):
         self.reject_unsupported_code(source_code)
         tree = libcst.parse_statement(source_code)
         self.verify_identical_asts(
-            source_code, libcst.Module([]).code_for_node(tree), mode="single"
+            source_code, _EMPTY_MODULE.code_for_node(tree), mode="single"
         )
 
     def verify_identical_asts(
@@ -150,20 +176,13 @@ class FuzzTest(unittest.TestCase):
         # e.g. `eval` only being a keyword in Python 3.7
         assert mode in {"eval", "exec", "single"}
         hypothesis.note(source_code)
-        try:
-            compile(source_code, "<string>", mode)
-        except Exception:
+        if not _compiles(source_code, mode):
             # We're going to check here that libCST also rejects this string.
             # If libCST parses it's a test failure; if not we reject this input
             # so Hypothesis spends as little time as possible exploring invalid
             # code. (usually I'd use a custom mutator, but this is free so...)
-            parser = dict(
-                eval=libcst.parse_expression,
-                exec=libcst.parse_module,
-                single=libcst.parse_statement,
-            )
             try:
-                tree = parser[mode](source_code)
+                tree = _PARSER_BY_MODE[mode](source_code)
                 msg = f"libCST parsed a string rejected by compile() into {tree!r}"
                 assert False, msg
             except Exception:
@@ -190,5 +209,30 @@ class FuzzTest(unittest.TestCase):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--profile-output", default="fuzz.prof")
+    args, remaining = parser.parse_known_args()
+    if args.jobs > 1:
+        # Each worker is an independent fuzzing session with its own random seed,
+        # and writes its own profile so they don't overwrite each other.
+        workers = []
+        for i in range(args.jobs):
+            worker_args = [sys.executable, __file__, *remaining]
+            if args.profile:
+                worker_args += ["--profile", "--profile-output", f"fuzz.{i}.prof"]
+            workers.append(subprocess.Popen(worker_args))
+        sys.exit(int(any([worker.wait() for worker in workers])))
     hypothesis.settings.load_profile("settings-for-fuzzing")
-    unittest.main()
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            unittest.main(argv=[sys.argv[0], *remaining])
+        finally:
+            # Fuzzing runs until interrupted, so this also covers Ctrl-C.
+            profiler.disable()
+            profiler.dump_stats(args.profile_output)
+    else:
+        unittest.main(argv=[sys.argv[0], *remaining])